@@ -5,33 +5,95 @@
 import sys
 import os
 import time
+import threading
 import webbrowser
-from typing import Dict, Any, List, Tuple
+import functools
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Callable
 from io import BytesIO
 
 # Force qtawesome to use PyQt6 for icon rendering
 os.environ['QT_API'] = 'pyqt6'
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+
+# orjson decodes GitHub's large event payloads noticeably faster; fall back to the stdlib.
+try:
+    from orjson import loads as json_loads, JSONDecodeError
+except ImportError:
+    from json import loads as json_loads, JSONDecodeError
 import qtawesome as qta
 from PyQt6.QtCore import (
-    Qt, QObject, QRunnable, pyqtSignal, pyqtSlot, QThreadPool, QTimer,
-    QPropertyAnimation, QEasingCurve
+    Qt, QObject, QRunnable, pyqtSignal, pyqtSlot, QThreadPool, QTimer, QDateTime,
+    QPropertyAnimation, QEasingCurve, QAbstractTableModel, QModelIndex
 )
 from PyQt6.QtGui import (
-    QPixmap, QColor, QFont, QPainter, QBrush, QAction, QPainterPath
+    QPixmap, QImage, QColor, QFont, QPainter, QBrush, QAction, QPainterPath, QIcon,
+    QShortcut, QKeySequence
 )
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QFrame,
+    QPushButton, QTableView, QHeaderView, QFrame,
     QAbstractItemView, QMessageBox, QMenu, QStackedWidget
 )
 
 # --- Configuration ---
 GITHUB_API_URL = "https://api.github.com"
+USER_URL_TMPL = GITHUB_API_URL + "/users/{}"
+EVENTS_URL_TMPL = GITHUB_API_URL + "/users/{}/events"
+RATE_LIMIT_URL = GITHUB_API_URL + "/rate_limit"
 CACHE_DURATION_SECONDS = 300  # 5 minutes
+CACHE_CAPACITY = 32  # Max usernames kept in memory
+AVATAR_CACHE_TTL = float('inf')  # Avatars are revalidated with their ETag instead
 WINDOW_TITLE = "GitHub Activity Viewer"
+MAX_EVENTS = 50  # Rows shown in the activity table
+FETCH_DEBOUNCE_MS = 300  # Coalesces repeated Enter presses / button clicks
+AVATAR_SIZE = 48  # Displayed avatar diameter in device-independent pixels
 USER_AGENT = "GitHub-Activity-Viewer-V2"
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+POOL_MAXSIZE = 8  # Max connections kept per host; also caps in-flight requests
+
+# --- HTTP Session ---
+# Shared across workers so urllib3 can keep connections to GitHub alive.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT, 'Accept': 'application/vnd.github+json'})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE))
+# Bounds concurrent requests across all workers so bursts never outgrow the pool.
+REQUEST_SLOTS = threading.BoundedSemaphore(POOL_MAXSIZE)
+
+# --- Cache ---
+class LRUCache:
+    """A thread-safe, size-bounded cache whose entries expire after a TTL."""
+    def __init__(self, capacity: int = CACHE_CAPACITY, ttl: float = CACHE_DURATION_SECONDS):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry['timestamp'] >= self.ttl:
+                self._data.pop(key)
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key, entry: dict):
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
 
 # --- Theming and Icons ---
 EVENT_ICONS = {
@@ -43,6 +105,54 @@ EVENT_ICONS = {
     'default': 'fa5s.question-circle',
 }
 
+# Event type -> (short label, icon name), resolved once instead of per table row.
+_TYPE_TABLE = {
+    type_: (type_.replace('Event', ''), icon) for type_, icon in EVENT_ICONS.items() if type_ != 'default'
+}
+_DEFAULT_ICON = EVENT_ICONS['default']
+
+# --- Event Summaries ---
+# Each summarizer takes (payload, repo_name, repo_url) and returns (summary, url).
+def _push_summary(payload, repo_name, repo_url):
+    return f"Pushed {payload.get('size', 0)} commit(s) to {repo_name}", repo_url
+
+def _issue_summary(payload, repo_name, repo_url):
+    issue = payload.get('issue', {})
+    summary = f"{payload.get('action','').capitalize()} issue in {repo_name}: '{issue.get('title', 'N/A')}'"
+    return summary, issue.get('html_url', repo_url)
+
+def _issue_comment_summary(payload, repo_name, repo_url):
+    return f"Commented on an issue in {repo_name}", payload.get('comment', {}).get('html_url', repo_url)
+
+def _pull_request_summary(payload, repo_name, repo_url):
+    pr = payload.get('pull_request', {})
+    summary = f"{payload.get('action','').capitalize()} PR #{pr.get('number', '')} in {repo_name}"
+    return summary, pr.get('html_url', repo_url)
+
+def _watch_summary(payload, repo_name, repo_url):
+    return f"Starred {repo_name}", repo_url
+
+def _fork_summary(payload, repo_name, repo_url):
+    forkee = payload.get('forkee', {})
+    return f"Forked {repo_name} to {forkee.get('full_name', 'N/A')}", forkee.get('html_url', repo_url)
+
+def _create_summary(payload, repo_name, repo_url):
+    return f"Created {payload.get('ref_type', 'N/A')} in {repo_name}", repo_url
+
+def _delete_summary(payload, repo_name, repo_url):
+    return f"Deleted {payload.get('ref_type', 'N/A')} in {repo_name}", repo_url
+
+def _release_summary(payload, repo_name, repo_url):
+    return f"Published release in {repo_name}", payload.get('release', {}).get('html_url', repo_url)
+
+_SUMMARIZERS: Dict[str, Callable[[Dict[str, Any], str, str], Tuple[str, str]]] = {
+    'PushEvent': _push_summary, 'IssuesEvent': _issue_summary,
+    'IssueCommentEvent': _issue_comment_summary, 'PullRequestEvent': _pull_request_summary,
+    'WatchEvent': _watch_summary, 'ForkEvent': _fork_summary,
+    'CreateEvent': _create_summary, 'DeleteEvent': _delete_summary,
+    'ReleaseEvent': _release_summary,
+}
+
 THEMES = {
     'light': {
         'bg': '#f6f8fa', 'panel_bg': '#ffffff', 'text': '#24292f',
@@ -56,78 +166,195 @@ THEMES = {
     }
 }
 
+# --- Stylesheets ---
+# Built once per theme at import time; _set_theme only applies the finished strings.
+def _build_qss(palette: Dict[str, str]) -> str:
+    return f"""
+        QWidget {{ background-color: {palette['bg']}; color: {palette['text']}; }}
+        QTableView {{ 
+            background-color: {palette['panel_bg']};
+            border: 1px solid {palette['border']}; border-radius: 8px;
+        }}
+        QHeaderView::section {{
+            background-color: {palette['bg']}; color: {palette['subtle_text']};
+            padding: 8px; border: none; border-bottom: 1px solid {palette['border']};
+        }}
+        QTableView::item {{ padding-left: 10px; border-bottom: 1px solid {palette['border']}; }}
+        QTableView::item:selected {{ background-color: {palette['accent']}; color: {palette['accent_text']}; }}
+        #userFrame {{
+            background-color: {palette['panel_bg']};
+            border: 1px solid {palette['border']}; border-radius: 8px;
+        }}
+        QLineEdit {{
+            padding: 8px 12px; border-radius: 8px;
+            border: 1px solid {palette['border']}; background-color: {palette['panel_bg']};
+        }}
+        QLineEdit:focus {{ border: 1px solid {palette['accent']}; }}
+    """
+
+def _build_theme_btn_qss(palette: Dict[str, str]) -> str:
+    return f"""
+        QPushButton {{ background-color: transparent; border: 1px solid {palette['border']}; border-radius: 18px; }}
+        QPushButton:hover {{ background-color: {palette['border']}; }}
+    """
+
+def _build_btn_qss(palette: Dict[str, str]) -> str:
+    return f"""
+        QPushButton {{ padding: 8px 16px; border-radius: 8px; border: none;
+                     background-color: {palette['accent']}; color: {palette['accent_text']}; }}
+    """
+
+COMPILED_QSS = {name: _build_qss(palette) for name, palette in THEMES.items()}
+COMPILED_THEME_BTN_QSS = {name: _build_theme_btn_qss(palette) for name, palette in THEMES.items()}
+COMPILED_BTN_QSS = {name: _build_btn_qss(palette) for name, palette in THEMES.items()}
+COMPILED_SUBTLE_QSS = {name: f"color: {palette['subtle_text']};" for name, palette in THEMES.items()}
+
+@functools.lru_cache(maxsize=64)
+def _cached_icon(name: str, color: str) -> QIcon:
+    """Returns a qtawesome icon, rendering each (name, color) pair only once."""
+    return qta.icon(name, color=color)
+
 # --- Worker Signals ---
 class WorkerSignals(QObject):
     """Defines signals available from a running worker thread."""
     user_data = pyqtSignal(dict, dict)  # user info, rate limits
     events_data = pyqtSignal(list)
-    avatar_data = pyqtSignal(QPixmap)
+    avatar_data = pyqtSignal(QImage)  # Pre-scaled; QImage is safe to build off the GUI thread
     error = pyqtSignal(str, str)
+    finished = pyqtSignal()
 
 # --- Network Worker ---
 class NetworkWorker(QRunnable):
     """Worker thread for fetching user data and events from GitHub."""
-    def __init__(self, username: str, cache: dict):
+    def __init__(self, username: str, cache: LRUCache, avatar_cache: LRUCache,
+                 session: requests.Session = SESSION, force: bool = False,
+                 cancelled: threading.Event = None, device_pixel_ratio: float = 1.0):
         super().__init__()
         self.signals = WorkerSignals()
         self.username = username
         self.cache = cache
+        self.force = force  # Bypass fresh cache entries, but still store the new response
+        self.avatar_cache = avatar_cache
+        self.session = session
+        # Set by the UI once a newer fetch supersedes this one.
+        self.cancelled = cancelled or threading.Event()
+        # Avatars are fetched and scaled at the screen's physical resolution.
+        self.device_pixel_ratio = device_pixel_ratio
+        self.avatar_px = round(AVATAR_SIZE * device_pixel_ratio)
+
+    def _get(self, url: str, headers: dict = None) -> requests.Response:
+        with REQUEST_SLOTS:
+            return self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+    def _get_json(self, url: str):
+        """Streams a (potentially large) JSON body straight into the decoder."""
+        with REQUEST_SLOTS, self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as res:
+            res.raise_for_status()
+            # Reading raw bypasses requests' exception wrapping; map urllib3 errors the way iter_content does.
+            try:
+                body = res.raw.read(decode_content=True)
+            except ReadTimeoutError as e:
+                raise requests.exceptions.ReadTimeout(e, request=res.request) from e
+            except ProtocolError as e:
+                raise requests.exceptions.ChunkedEncodingError(e, request=res.request) from e
+            except DecodeError as e:
+                raise requests.exceptions.ContentDecodingError(e, request=res.request) from e
+        return json_loads(body)
+
+    def _get_avatar(self, url: str) -> bytes:
+        """Downloads avatar bytes, revalidating any cached copy by its ETag."""
+        # Let the CDN downscale instead of sending the full-resolution original.
+        url = f"{url}{'&' if '?' in url else '?'}s={self.avatar_px}"
+        cached = self.avatar_cache.get(url)
+        headers = {'If-None-Match': cached['etag']} if cached and cached['etag'] else None
+        avatar_res = self._get(url, headers=headers)
+        if avatar_res.status_code == 304 and cached:
+            return cached['bytes']
+
+        avatar_res.raise_for_status()
+        self.avatar_cache.set(url, {
+            'timestamp': time.time(), 'etag': avatar_res.headers.get('ETag'), 'bytes': avatar_res.content
+        })
+        return avatar_res.content
 
     @pyqtSlot()
     def run(self):
         try:
-            cached = self.cache.get(self.username)
-            if cached and time.time() - cached['timestamp'] < CACHE_DURATION_SECONDS:
-                user_info, events, rate_limits = (
-                    cached['data']['user'], cached['data']['events'], cached['data']['rates']
-                )
-            else:
-                headers = {'User-Agent': USER_AGENT}
-                user_res = requests.get(f"{GITHUB_API_URL}/users/{self.username}", headers=headers)
-                rate_limit_res = requests.get(f"{GITHUB_API_URL}/rate_limit", headers=headers)
-                rate_limits = rate_limit_res.json()
-
-                if user_res.status_code != 200:
-                    raise ValueError(f"User '{self.username}' not found (status {user_res.status_code}).")
-
-                user_info = user_res.json()
-                events_res = requests.get(user_info['events_url'].replace('{/privacy}', ''), headers=headers)
-                events = events_res.json()
-
-                self.cache[self.username] = {
-                    'timestamp': time.time(),
-                    'data': {'user': user_info, 'events': events, 'rates': rate_limits}
-                }
-
-            self.signals.user_data.emit(user_info, rate_limits)
-            self.signals.events_data.emit(events)
-
-            if avatar_url := user_info.get('avatar_url'):
-                avatar_res = requests.get(avatar_url, headers=headers)
-                avatar_res.raise_for_status()
-                pixmap = QPixmap()
-                pixmap.loadFromData(avatar_res.content)
-                self.signals.avatar_data.emit(pixmap)
-
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                avatar_future = None
+                if not self.force and (cached := self.cache.get(self.username)):
+                    user_info, events, rate_limits = (
+                        cached['data']['user'], cached['data']['events'], cached['data']['rates']
+                    )
+                    self.signals.user_data.emit(user_info, rate_limits)
+                    if not self.cancelled.is_set() and (avatar_url := user_info.get('avatar_url')):
+                        avatar_future = executor.submit(self._get_avatar, avatar_url)
+                else:
+                    # The events URL is known up front, so all three requests go out together.
+                    user_future = executor.submit(self._get, USER_URL_TMPL.format(self.username))
+                    rate_limit_future = executor.submit(self._get, RATE_LIMIT_URL)
+                    events_future = executor.submit(self._get_json, EVENTS_URL_TMPL.format(self.username))
+                    user_res, rate_limit_res = user_future.result(), rate_limit_future.result()
+                    rate_limits = json_loads(rate_limit_res.content)
+
+                    if user_res.status_code != 200:
+                        raise ValueError(f"User '{self.username}' not found (status {user_res.status_code}).")
+
+                    user_info = json_loads(user_res.content)
+                    # Show the user panel while events and avatar are still in flight.
+                    self.signals.user_data.emit(user_info, rate_limits)
+
+                    if not self.cancelled.is_set() and (avatar_url := user_info.get('avatar_url')):
+                        avatar_future = executor.submit(self._get_avatar, avatar_url)
+                    # Already in flight; still worth caching even if this fetch was superseded.
+                    events = events_future.result()
+
+                    self.cache.set(self.username, {
+                        'timestamp': time.time(),
+                        'data': {'user': user_info, 'events': events, 'rates': rate_limits}
+                    })
+
+                self.signals.events_data.emit(events)
+
+                if avatar_future:
+                    image = QImage.fromData(avatar_future.result()).scaled(
+                        self.avatar_px, self.avatar_px,
+                        Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation
+                    )
+                    image.setDevicePixelRatio(self.device_pixel_ratio)
+                    self.signals.avatar_data.emit(image)
+
+        except requests.exceptions.Timeout as e:
+            self.signals.error.emit("Network Timeout", f"GitHub API did not respond in time: {e}")
         except requests.exceptions.RequestException as e:
             self.signals.error.emit("Network Error", f"Could not connect to GitHub API: {e}")
+        except JSONDecodeError as e:
+            # Must precede ValueError: a garbled body (e.g. a 502 page) is not a missing user.
+            self.signals.error.emit("Network Error", f"GitHub API returned an invalid response: {e}")
         except ValueError as e:
             self.signals.error.emit("Not Found", str(e))
         except Exception as e:
             self.signals.error.emit("An Error Occurred", str(e))
+        finally:
+            self.signals.finished.emit()
 
 # --- UI Components ---
 class AvatarLabel(QLabel):
     """A QLabel that displays a pixmap in a circle."""
-    def __init__(self, size=48):
+    def __init__(self, size=AVATAR_SIZE):
         super().__init__()
         self.setFixedSize(size, size)
         self.pixmap = None
 
     def set_pixmap(self, pixmap: QPixmap):
-        self.pixmap = pixmap.scaled(
-            self.size(), Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation
-        )
+        mode = Qt.AspectRatioMode.KeepAspectRatioByExpanding
+        ratio = pixmap.devicePixelRatio()
+        target = self.size() * ratio
+        # Workers already deliver avatars at this size; only rescale anything else.
+        if pixmap.size().scaled(target, mode) != pixmap.size():
+            pixmap = pixmap.scaled(target, mode, Qt.TransformationMode.SmoothTransformation)
+            pixmap.setDevicePixelRatio(ratio)
+        self.pixmap = pixmap
         self.update()
 
     def paintEvent(self, event):
@@ -140,6 +367,103 @@ class AvatarLabel(QLabel):
         painter.setClipPath(path)
         painter.drawPixmap(0, 0, self.pixmap)
 
+class EventsModel(QAbstractTableModel):
+    """Table model over the fetched events; rows are plain tuples, not Qt items."""
+    HEADERS = ("", "Type", "Details", "Date")
+
+    def __init__(self, palette: Dict[str, str], parent=None):
+        super().__init__(parent)
+        self._icon_color = palette['subtle_text']
+        self._rows: List[tuple] = []  # (type_text, icon_name, summary, url, created_at)
+        self._sort = None
+
+    def reset_with(self, events: List[Dict[str, Any]]):
+        self.beginResetModel()
+        make_row = self._make_row
+        self._rows = [make_row(event) for event in itertools.islice(events, MAX_EVENTS)]
+        if self._sort:
+            self._sort_rows(*self._sort)
+        self.endResetModel()
+
+    def set_palette(self, palette: Dict[str, str]):
+        self._icon_color = palette['subtle_text']
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, 0), [Qt.ItemDataRole.DecorationRole]
+            )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        type_text, icon_name, summary, url, created_at = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            # The date stays a QDateTime so it renders in the user's locale.
+            return (None, type_text, summary, created_at)[column]
+        if role == Qt.ItemDataRole.DecorationRole and column == 0:
+            return _cached_icon(icon_name, self._icon_color)
+        if column == 2 and url:
+            if role == Qt.ItemDataRole.UserRole:
+                return url
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return f"Double-click to open in browser: {url}"
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_rows = self._sort_rows(column, order)
+        # Keep the selection and current index on the same events after they move.
+        new_row_of = {old_row: new_row for new_row, old_row in enumerate(old_rows)}
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_row_of[index.row()], index.column()) for index in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+    def _sort_rows(self, column, order) -> List[int]:
+        """Sorts rows in place and returns the old row number of each new position."""
+        # Column 0 has no text; sort it by the event's icon so equal types group together.
+        key_index = (1, 0, 2, 4)[column]
+        rows = self._rows
+        old_rows = sorted(
+            range(len(rows)), key=lambda row: rows[row][key_index], reverse=order == Qt.SortOrder.DescendingOrder
+        )
+        self._rows = [rows[row] for row in old_rows]
+        return old_rows
+
+    @classmethod
+    def _make_row(cls, event: Dict[str, Any]) -> tuple:
+        summary, url = cls._summarize_event(event)
+        type_ = event.get('type', 'UnknownEvent')
+        type_text, icon_name = _TYPE_TABLE.get(type_) or (type_.replace('Event', ''), _DEFAULT_ICON)
+        created_at = QDateTime.fromString(event.get('created_at', ''), Qt.DateFormat.ISODate).toLocalTime()
+        return type_text, icon_name, summary, url, created_at
+
+    @staticmethod
+    def _summarize_event(event: Dict[str, Any]) -> Tuple[str, str]:
+        repo_name = event.get('repo', {}).get('name', 'N/A')
+        repo_url = f"https://github.com/{repo_name}"
+        payload = event.get('payload', {})
+        type_ = event.get('type')
+
+        if summarizer := _SUMMARIZERS.get(type_):
+            return summarizer(payload, repo_name, repo_url)
+        # The generic fallback is the only summary that needs the event type itself.
+        return f"Performed {type_} in {repo_name}", repo_url
+
 class GitHubActivityApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -147,10 +471,18 @@ class GitHubActivityApp(QWidget):
         self.setMinimumSize(900, 700)
         self.theme = 'dark'
         self.thread_pool = QThreadPool()
-        self.cache = {}
+        self.cache = LRUCache()
+        self.avatar_cache = LRUCache(ttl=AVATAR_CACHE_TTL)
+        self.current_user = None
+        self._fetch_id = 0
+        self._active_fetch = None  # (fetch_id, username, cancel event) of the fetch on screen
         self._build_ui()
         self._set_theme()
 
+        self._msg_box = QMessageBox(self)
+        self._msg_box.setStyleSheet("QLabel{font-size: 11pt;} QPushButton{min-width: 80px;}")
+        self._pending_messages = deque()
+
     def _build_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -175,12 +507,17 @@ class GitHubActivityApp(QWidget):
         layout = QHBoxLayout()
         self.username_edit = QLineEdit()
         self.username_edit.setPlaceholderText("Enter GitHub Username")
-        self.username_edit.returnPressed.connect(self.start_fetch)
+        self.username_edit.returnPressed.connect(self._request_fetch)
         layout.addWidget(self.username_edit)
 
         self.show_btn = QPushButton("Show Activity")
         self.show_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.show_btn.clicked.connect(self.start_fetch)
+        self.show_btn.clicked.connect(self._request_fetch)
+
+        self._fetch_debounce = QTimer(self)
+        self._fetch_debounce.setSingleShot(True)
+        self._fetch_debounce.setInterval(FETCH_DEBOUNCE_MS)
+        self._fetch_debounce.timeout.connect(self.start_fetch)
         layout.addWidget(self.show_btn)
         
         self.theme_btn = QPushButton()
@@ -188,6 +525,14 @@ class GitHubActivityApp(QWidget):
         self.theme_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.theme_btn.clicked.connect(self.toggle_theme)
         layout.addWidget(self.theme_btn)
+
+        self.refresh_btn = QPushButton()
+        self.refresh_btn.setFixedSize(36, 36)
+        self.refresh_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.refresh_btn.setToolTip("Refresh, bypassing the cache")
+        self.refresh_btn.clicked.connect(self.refresh)
+        layout.addWidget(self.refresh_btn)
+        QShortcut(QKeySequence.StandardKey.Refresh, self, activated=self.refresh)
         
         layout.addStretch()
 
@@ -201,7 +546,7 @@ class GitHubActivityApp(QWidget):
         layout.setContentsMargins(20, 15, 20, 15)
         layout.setSpacing(15)
 
-        self.avatar_label = AvatarLabel(size=48)
+        self.avatar_label = AvatarLabel()
         layout.addWidget(self.avatar_label)
 
         self.userinfo_label = QLabel()
@@ -222,8 +567,9 @@ class GitHubActivityApp(QWidget):
         return widget
         
     def _create_table(self):
-        table = QTableWidget(0, 4)
-        table.setHorizontalHeaderLabels(["", "Type", "Details", "Date"])
+        table = QTableView()
+        self.model = EventsModel(THEMES[self.theme], table)
+        table.setModel(self.model)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         table.setShowGrid(False)
@@ -231,13 +577,16 @@ class GitHubActivityApp(QWidget):
         table.verticalHeader().setDefaultSectionSize(48)
         table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         table.customContextMenuRequested.connect(self._show_table_context_menu)
-        table.cellDoubleClicked.connect(self._open_event_url)
+        table.doubleClicked.connect(self._open_event_url)
 
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        # Newest first, matching the order GitHub returns events in.
+        header.setSortIndicator(3, Qt.SortOrder.DescendingOrder)
+        table.setSortingEnabled(True)
         return table
 
     def _create_footer(self):
@@ -254,75 +603,81 @@ class GitHubActivityApp(QWidget):
         font_main = QFont("Segoe UI", 10)
         self.setFont(font_main)
         
-        self.setStyleSheet(f"""
-            QWidget {{ background-color: {palette['bg']}; color: {palette['text']}; }}
-            QTableWidget {{ 
-                background-color: {palette['panel_bg']};
-                border: 1px solid {palette['border']}; border-radius: 8px;
-            }}
-            QHeaderView::section {{
-                background-color: {palette['bg']}; color: {palette['subtle_text']};
-                padding: 8px; border: none; border-bottom: 1px solid {palette['border']};
-            }}
-            QTableWidget::item {{ padding-left: 10px; border-bottom: 1px solid {palette['border']}; }}
-            QTableWidget::item:selected {{ background-color: {palette['accent']}; color: {palette['accent_text']}; }}
-            #userFrame {{
-                background-color: {palette['panel_bg']};
-                border: 1px solid {palette['border']}; border-radius: 8px;
-            }}
-            QLineEdit {{
-                padding: 8px 12px; border-radius: 8px;
-                border: 1px solid {palette['border']}; background-color: {palette['panel_bg']};
-            }}
-            QLineEdit:focus {{ border: 1px solid {palette['accent']}; }}
-        """)
-        
-        self.theme_btn.setIcon(qta.icon(palette['icon'], color=palette['icon_color']))
-        self.theme_btn.setStyleSheet(f"""
-            QPushButton {{ background-color: transparent; border: 1px solid {palette['border']}; border-radius: 18px; }}
-            QPushButton:hover {{ background-color: {palette['border']}; }}
-        """)
-        self.show_btn.setStyleSheet(f"""
-            QPushButton {{ padding: 8px 16px; border-radius: 8px; border: none;
-                         background-color: {palette['accent']}; color: {palette['accent_text']}; }}
-        """)
-        self.rate_limit_label.setStyleSheet(f"color: {palette['subtle_text']};")
-        self.summary_label.setStyleSheet(f"color: {palette['subtle_text']};")
-        
-        if self.user_frame.isVisible():
-            self.start_fetch(force_refresh=True)
+        self.setStyleSheet(COMPILED_QSS[self.theme])
+        self.theme_btn.setIcon(_cached_icon(palette['icon'], palette['icon_color']))
+        self.theme_btn.setStyleSheet(COMPILED_THEME_BTN_QSS[self.theme])
+        self.refresh_btn.setIcon(_cached_icon('fa5s.sync-alt', palette['icon_color']))
+        self.refresh_btn.setStyleSheet(COMPILED_THEME_BTN_QSS[self.theme])
+        self.show_btn.setStyleSheet(COMPILED_BTN_QSS[self.theme])
+        self.rate_limit_label.setStyleSheet(COMPILED_SUBTLE_QSS[self.theme])
+        self.summary_label.setStyleSheet(COMPILED_SUBTLE_QSS[self.theme])
+
+        # Restyle what is already on screen; the data itself has not changed.
+        self.model.set_palette(palette)
+        if self.current_user:
+            self._render_user_info(self.current_user)
 
     def toggle_theme(self):
         self.theme = 'dark' if self.theme == 'light' else 'light'
+        _cached_icon.cache_clear()
         self._set_theme()
 
+    def refresh(self):
+        if self.refresh_btn.isEnabled():
+            self.start_fetch(force_refresh=True)
+
+    def _request_fetch(self):
+        # Each press restarts the timer, so a burst of input results in a single fetch.
+        self._fetch_debounce.start()
+
     def start_fetch(self, force_refresh=False):
         username = self.username_edit.text().strip()
         if not username:
             self._show_message("Input Required", "Please enter a GitHub username.")
             return
+        if self._active_fetch:
+            _, active_username, active_cancelled = self._active_fetch
+            if active_username == username:
+                return
+            active_cancelled.set()
+
+        self._fetch_id += 1
+        fetch_id, cancelled = self._fetch_id, threading.Event()
+        self._active_fetch = (fetch_id, username, cancelled)
 
         self.show_btn.setEnabled(False)
+        self.refresh_btn.setEnabled(False)
         self.user_frame.hide()
         self.summary_label.setText("")
         self.rate_limit_label.setText("")
-        self.table.setRowCount(0)
+        self.model.reset_with([])
         self.results_stack.setCurrentWidget(self.loading_widget)
         self.loading_animation.start()
 
-        effective_cache = {} if force_refresh else self.cache
-        worker = NetworkWorker(username, effective_cache)
-        worker.signals.user_data.connect(self.on_user_data)
-        worker.signals.events_data.connect(self.on_events_data)
-        worker.signals.avatar_data.connect(self.on_avatar_data)
-        worker.signals.error.connect(self.on_fetch_error)
+        worker = NetworkWorker(
+            username, self.cache, self.avatar_cache, force=force_refresh, cancelled=cancelled,
+            device_pixel_ratio=self.avatar_label.devicePixelRatioF()
+        )
+        worker.signals.user_data.connect(self._for_fetch(fetch_id, self.on_user_data))
+        worker.signals.events_data.connect(self._for_fetch(fetch_id, self.on_events_data))
+        worker.signals.avatar_data.connect(self._for_fetch(fetch_id, self.on_avatar_data))
+        worker.signals.error.connect(self._for_fetch(fetch_id, self.on_fetch_error))
+        worker.signals.finished.connect(self._for_fetch(fetch_id, self._on_fetch_finished))
         self.thread_pool.start(worker)
 
+    def _for_fetch(self, fetch_id, slot):
+        """Wraps a slot so results from a superseded fetch are dropped."""
+        def guarded(*args):
+            if self._active_fetch and self._active_fetch[0] == fetch_id:
+                slot(*args)
+        return guarded
+
+    def _on_fetch_finished(self):
+        self._active_fetch = None
+
     def on_user_data(self, user_info, rate_limits):
-        name = user_info.get('name') or user_info.get('login')
-        profile_url = user_info.get('html_url', '')
-        palette = THEMES[self.theme]
-        self.userinfo_label.setText(f"<a href='{profile_url}' style='color:{palette['text']}; text-decoration:none;'>{name}</a>")
+        self.current_user = user_info
+        self._render_user_info(user_info)
         self.userinfo_label.setOpenExternalLinks(True)
 
         self.user_frame.setWindowOpacity(0)
@@ -336,124 +691,79 @@ class GitHubActivityApp(QWidget):
         core = rate_limits.get('resources', {}).get('core', {})
         self.rate_limit_label.setText(f"API Rate: {core.get('remaining')} / {core.get('limit')}")
 
+    def _render_user_info(self, user_info):
+        name = user_info.get('name') or user_info.get('login')
+        profile_url = user_info.get('html_url', '')
+        palette = THEMES[self.theme]
+        self.userinfo_label.setText(f"<a href='{profile_url}' style='color:{palette['text']}; text-decoration:none;'>{name}</a>")
+
     def on_events_data(self, events):
         if isinstance(events, dict) and 'message' in events:
             self.on_fetch_error("API Error", events['message'])
             return
             
-        self.table.setRowCount(0)
-        palette = THEMES[self.theme]
-        for event in events[:50]:
-            row_pos = self.table.rowCount()
-            self.table.insertRow(row_pos)
-            
-            summary, url = self._summarize_event(event)
-            type_text = event.get('type', 'UnknownEvent').replace('Event', '')
-            icon_name = EVENT_ICONS.get(event.get('type'), EVENT_ICONS['default'])
-            date_text = event.get('created_at', '').replace('T', ' ').replace('Z', '')
-
-            icon_item = QTableWidgetItem()
-            icon_item.setIcon(qta.icon(icon_name, color=palette['subtle_text']))
-            
-            summary_item = QTableWidgetItem(summary)
-            if url:
-                summary_item.setData(Qt.ItemDataRole.UserRole, url)
-                summary_item.setToolTip(f"Double-click to open in browser: {url}")
-
-            self.table.setItem(row_pos, 0, icon_item)
-            self.table.setItem(row_pos, 1, QTableWidgetItem(type_text))
-            self.table.setItem(row_pos, 2, summary_item)
-            self.table.setItem(row_pos, 3, QTableWidgetItem(date_text))
-        
-        self.summary_label.setText(f"Showing {self.table.rowCount()} recent events.")
+        self.model.reset_with(events)
+        self.summary_label.setText(f"Showing {self.model.rowCount()} recent events.")
         self.results_stack.setCurrentWidget(self.table)
         self.loading_animation.stop()
         self.show_btn.setEnabled(True)
+        self.refresh_btn.setEnabled(True)
 
-    def on_avatar_data(self, pixmap):
-        self.avatar_label.set_pixmap(pixmap)
+    def on_avatar_data(self, image):
+        self.avatar_label.set_pixmap(QPixmap.fromImage(image))
 
     def on_fetch_error(self, title, message):
         self._show_message(title, message, icon=QMessageBox.Icon.Critical)
         self.results_stack.setCurrentWidget(self.table)
         self.loading_animation.stop()
         self.show_btn.setEnabled(True)
+        self.refresh_btn.setEnabled(True)
         self.rate_limit_label.setText("API Status: Error")
 
-    @staticmethod
-    def _summarize_event(event: Dict[str, Any]) -> Tuple[str, str]:
-        repo_name = event.get('repo', {}).get('name', 'N/A')
-        repo_url = f"https://github.com/{repo_name}"
-        payload = event.get('payload', {})
-        type_ = event.get('type')
-        
-        url, summary = repo_url, f"Performed {type_} in {repo_name}"
-
-        if type_ == 'PushEvent':
-            summary = f"Pushed {payload.get('size', 0)} commit(s) to {repo_name}"
-        elif type_ == 'IssuesEvent':
-            issue = payload.get('issue', {})
-            url = issue.get('html_url', repo_url)
-            summary = f"{payload.get('action','').capitalize()} issue in {repo_name}: '{issue.get('title', 'N/A')}'"
-        elif type_ == 'IssueCommentEvent':
-            url = payload.get('comment', {}).get('html_url', repo_url)
-            summary = f"Commented on an issue in {repo_name}"
-        elif type_ == 'PullRequestEvent':
-            pr = payload.get('pull_request', {})
-            url = pr.get('html_url', repo_url)
-            summary = f"{payload.get('action','').capitalize()} PR #{pr.get('number', '')} in {repo_name}"
-        elif type_ == 'WatchEvent':
-            summary = f"Starred {repo_name}"
-        elif type_ == 'ForkEvent':
-            forkee = payload.get('forkee', {})
-            url = forkee.get('html_url', repo_url)
-            summary = f"Forked {repo_name} to {forkee.get('full_name', 'N/A')}"
-        elif type_ in ['CreateEvent', 'DeleteEvent']:
-            action = 'Created' if type_ == 'CreateEvent' else 'Deleted'
-            summary = f"{action} {payload.get('ref_type', 'N/A')} in {repo_name}"
-        elif type_ == 'ReleaseEvent':
-            release = payload.get('release', {})
-            url = release.get('html_url', repo_url)
-            summary = f"Published release in {repo_name}"
-        
-        return summary, url
-
     def _show_table_context_menu(self, pos):
-        item = self.table.itemAt(pos)
-        if not item: return
+        index = self.table.indexAt(pos)
+        if not index.isValid(): return
 
         menu = QMenu(self)
-        summary_item = self.table.item(item.row(), 2)
-        url = summary_item.data(Qt.ItemDataRole.UserRole)
+        summary_index = self.model.index(index.row(), 2)
+        summary = summary_index.data()
+        url = summary_index.data(Qt.ItemDataRole.UserRole)
         palette = THEMES[self.theme]
         
+        clipboard = QApplication.clipboard()
+
+        # Actions are parented to the menu so they are freed along with it.
         if url:
-            open_action = QAction(qta.icon('fa5s.external-link-alt', color=palette['text']), "Open on GitHub", self)
-            open_action.triggered.connect(lambda: webbrowser.open(url))
+            open_action = QAction(_cached_icon('fa5s.external-link-alt', palette['text']), "Open on GitHub", menu)
+            open_action.triggered.connect(functools.partial(webbrowser.open, url))
             menu.addAction(open_action)
             
-            copy_url_action = QAction("Copy Link", self)
-            copy_url_action.triggered.connect(lambda: QApplication.clipboard().setText(url))
+            copy_url_action = QAction("Copy Link", menu)
+            copy_url_action.triggered.connect(functools.partial(clipboard.setText, url))
             menu.addAction(copy_url_action)
             menu.addSeparator()
 
-        copy_summary_action = QAction("Copy Summary", self)
-        copy_summary_action.triggered.connect(lambda: QApplication.clipboard().setText(summary_item.text()))
+        copy_summary_action = QAction("Copy Summary", menu)
+        copy_summary_action.triggered.connect(functools.partial(clipboard.setText, summary))
         menu.addAction(copy_summary_action)
         menu.exec(self.table.mapToGlobal(pos))
+        menu.deleteLater()
         
-    def _open_event_url(self, row, column):
-        item = self.table.item(row, 2)
-        if item and (url := item.data(Qt.ItemDataRole.UserRole)):
+    def _open_event_url(self, index):
+        if url := self.model.index(index.row(), 2).data(Qt.ItemDataRole.UserRole):
             webbrowser.open(url)
 
     def _show_message(self, title, text, icon=QMessageBox.Icon.Information):
-        box = QMessageBox(self)
-        box.setIcon(icon)
-        box.setWindowTitle(title)
-        box.setText(text)
-        box.setStyleSheet("QLabel{font-size: 11pt;} QPushButton{min-width: 80px;}")
-        box.exec()
+        self._pending_messages.append((title, text, icon))
+        if self._msg_box.isVisible():
+            # Called from inside the open box's exec(); it is shown once the current one is dismissed.
+            return
+        while self._pending_messages:
+            title, text, icon = self._pending_messages.popleft()
+            self._msg_box.setIcon(icon)
+            self._msg_box.setWindowTitle(title)
+            self._msg_box.setText(text)
+            self._msg_box.exec()
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)